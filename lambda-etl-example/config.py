@@ -10,3 +10,6 @@ TABLE = GLUE_TABLE = 'example_table'
 KEY             = f'area={AREA}/source={SOURCE}/table={TABLE}'
 PATH_TRUSTED    = f's3://{BUCKET_TRUSTED}/{KEY}'
 
+#LEDGER
+LEDGER_BACKEND  = 'dynamodb'
+LEDGER_TABLE    = 'etl_processed_objects'
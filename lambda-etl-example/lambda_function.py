@@ -1,8 +1,11 @@
-from parse_s3_event import parse_s3_event
+from parse_s3_event import parse_s3_object
 from extract import extract_parquet
 from load import load_parquet
+from processed_ledger import get_ledger, PROCESSED, IN_PROGRESS
 
-from config import PATH_TRUSTED, GLUE_DATABASE, GLUE_TABLE
+from config import PATH_TRUSTED, GLUE_DATABASE, GLUE_TABLE, LEDGER_BACKEND, LEDGER_TABLE
+
+ledger = get_ledger(LEDGER_BACKEND, LEDGER_TABLE)
 
 def lambda_handler(event, context):
     """
@@ -11,23 +14,62 @@ def lambda_handler(event, context):
     Retorna:
     - 200 se o processo ETL for bem-sucedido.
     - 204 se não houver dados para processar.
+    - 208 se o objeto (mesmo bucket, key, ETag e tamanho) já foi processado.
+
+    Levanta RuntimeError se outra invocação ainda estiver processando o objeto, para que o evento seja reenviado.
 
     """
-    # Etapa 1: Extração dos dados
-    bucket, key = parse_s3_event(event)
-    data = extract_parquet(bucket, key)
-
-    if data:
-        # Etapa 2: Transformação
-        df = data.dropna(subset=['dt']).drop_duplicates(subset=['dt'])
-
-        # Etapa 3: Carregamento
-        response = load_parquet(PATH_TRUSTED, 
-                                df, 
-                                partition_cols=['dt'], 
-                                mode='overwrite_partitions', 
-                                database=GLUE_DATABASE, 
-                                table=GLUE_TABLE)
+    bucket, key, etag, size = parse_s3_object(event)
+
+    # Etapa 0: Reserva o objeto no ledger, ignorando eventos duplicados e arquivos idênticos reenviados
+    use_ledger = etag is not None and size is not None
+
+    if not use_ledger:
+        print(f"Evento sem ETag/tamanho para s3://{bucket}/{key}. Processando sem o ledger.")
+
+    else:
+        # A reserva expira junto com esta invocação, liberando as retentativas após timeout ou falta de memória
+        timeout_seconds = context.get_remaining_time_in_millis() / 1000 if context else None
+        status = ledger.claim(bucket, key, etag, size, timeout_seconds=timeout_seconds)
+
+        if status == PROCESSED:
+            print(f"Objeto s3://{bucket}/{key} já processado. Ignorando.")
+            return {
+                    'statusCode': 208,
+                    'body': "Objeto já processado."
+                    }
+
+        if status == IN_PROGRESS:
+            raise RuntimeError(f"Objeto s3://{bucket}/{key} em processamento por outra invocação. O evento será reenviado.")
+
+    try:
+        # Etapa 1: Extração dos dados
+        data = extract_parquet(bucket=bucket, key=key)
+        response = []
+
+        if not data.empty:
+            # Etapa 2: Transformação
+            df = data.dropna(subset=['dt']).drop_duplicates(subset=['dt'])
+
+            # Etapa 3: Carregamento
+            response = load_parquet(PATH_TRUSTED,
+                                    df,
+                                    partition_cols=['dt'],
+                                    mode='overwrite_partitions',
+                                    database=GLUE_DATABASE,
+                                    table=GLUE_TABLE)
+
+    except Exception:
+        # Libera a reserva para que a próxima entrega do evento possa reprocessar o objeto
+        if use_ledger:
+            ledger.release(bucket, key, etag, size)
+        raise
+
+    # Etapa 4: Registro do objeto processado
+    if use_ledger:
+        ledger.mark_processed(bucket, key, etag, size, response)
+
+    if response:
         return {
                 'statusCode': 200,
                 'body': {'message': "ETL bem sucedido.",
@@ -39,4 +81,3 @@ def lambda_handler(event, context):
             'body': "Sem dados."
             }
 
-
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 def parse_s3_event(event: dict) -> Tuple[str, str]:
     """
@@ -17,4 +17,25 @@ def parse_s3_event(event: dict) -> Tuple[str, str]:
 
     print(f'Bucket: {bucket}, Path: {key}')
     
-    return bucket, key
\ No newline at end of file
+    return bucket, key
+
+def parse_s3_object(event: dict) -> Tuple[str, str, Optional[str], Optional[int]]:
+    """
+    Extracts the bucket name, file path, ETag and size of the object from an S3 event.
+
+    Args:
+        event (dict): The S3 event received by the Lambda function.
+
+    Returns:
+        tuple: A tuple containing the bucket name, the S3 file path, the object ETag and its size in bytes.
+            ETag and size are None when the event does not include them.
+    """
+    bucket, key = parse_s3_event(event)
+    s3_object = event['Records'][0]['s3']['object']
+
+    etag = s3_object.get('eTag') or None
+    size = int(s3_object['size']) if s3_object.get('size') is not None else None
+
+    print(f'ETag: {etag}, Size: {size}')
+
+    return bucket, key, etag, size
@@ -0,0 +1,223 @@
+import json
+import time
+import boto3
+import sqlite3
+from datetime import datetime
+from typing import List
+
+CLAIMED = 'CLAIMED'
+IN_PROGRESS = 'IN_PROGRESS'
+PROCESSED = 'PROCESSED'
+
+class ProcessedLedger:
+    """
+    Base class for the ledger of S3 objects already processed by the Lambda.
+    There is one entry per bucket and key, holding the ETag and size of the last version
+    claimed, so re-deliveries of the same event and re-uploads of identical files are detected,
+    while a new version of the object (including a return to an older content, A -> B -> A)
+    is processed again.
+
+    An object is first claimed atomically (status IN_PROGRESS), so concurrent duplicate
+    deliveries cannot both process it. The claim is then finalized by `mark_processed`
+    or removed by `release` if processing fails. A claim expires after `timeout_seconds`
+    (pass the remaining time of the invocation), so retries of an invocation that timed out
+    or ran out of memory can take it over.
+
+    Subclasses must implement `claim`, `mark_processed` and `release`.
+
+    Args:
+        claim_timeout_seconds (int, optional): Default lifetime of a claim when `claim` gets no timeout. Default is 900.
+    """
+
+    def __init__(self, claim_timeout_seconds: int = 900):
+        self.claim_timeout_seconds = claim_timeout_seconds
+
+    @staticmethod
+    def object_key(bucket: str, key: str) -> str:
+        return f's3://{bucket}/{key}'
+
+    def _expires_at(self, timeout_seconds: float = None) -> int:
+        if timeout_seconds is None:
+            timeout_seconds = self.claim_timeout_seconds
+
+        return int(time.time() + timeout_seconds) + 1
+
+    def claim(self, bucket: str, key: str, etag: str, size: int, timeout_seconds: float = None) -> str:
+        """
+        Claims an object version for processing.
+
+        Returns:
+            str: CLAIMED if the caller must process the object, PROCESSED if this version was already
+                processed, or IN_PROGRESS if another invocation holds a claim that has not expired.
+        """
+        raise NotImplementedError
+
+    def mark_processed(self, bucket: str, key: str, etag: str, size: int, output_paths: List[str]) -> None:
+        raise NotImplementedError
+
+    def release(self, bucket: str, key: str, etag: str, size: int) -> None:
+        raise NotImplementedError
+
+class SQLiteLedger(ProcessedLedger):
+    """
+    Stores processed objects in a local SQLite database. Intended for tests and local runs.
+
+    Args:
+        path (str, optional): Path to the SQLite file. Default is '/tmp/processed_objects.db'.
+        claim_timeout_seconds (int, optional): Default lifetime of a claim when `claim` gets no timeout. Default is 900.
+    """
+
+    def __init__(self, path: str = '/tmp/processed_objects.db', claim_timeout_seconds: int = 900):
+        super().__init__(claim_timeout_seconds)
+        self.path = path
+
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed_objects ("
+                "object_key TEXT PRIMARY KEY, "
+                "etag TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "status TEXT NOT NULL, "
+                "expires_at INTEGER NOT NULL, "
+                "output_paths TEXT, "
+                "processed_at TEXT)"
+            )
+
+    def claim(self, bucket: str, key: str, etag: str, size: int, timeout_seconds: float = None) -> str:
+        object_key = self.object_key(bucket, key)
+        etag = etag.strip('"')
+
+        with sqlite3.connect(self.path, isolation_level='IMMEDIATE') as conn:
+            row = conn.execute(
+                "SELECT etag, size, status, expires_at FROM processed_objects WHERE object_key = ?",
+                (object_key,)
+            ).fetchone()
+
+            if row and row[0] == etag and row[1] == size:
+                if row[2] == PROCESSED:
+                    return PROCESSED
+
+                if row[3] >= time.time():
+                    return IN_PROGRESS
+
+            conn.execute(
+                "INSERT OR REPLACE INTO processed_objects (object_key, etag, size, status, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (object_key, etag, size, IN_PROGRESS, self._expires_at(timeout_seconds))
+            )
+
+        return CLAIMED
+
+    def mark_processed(self, bucket: str, key: str, etag: str, size: int, output_paths: List[str]) -> None:
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "UPDATE processed_objects SET status = ?, output_paths = ?, processed_at = ? "
+                "WHERE object_key = ? AND etag = ? AND size = ?",
+                (PROCESSED, json.dumps(output_paths), datetime.utcnow().isoformat(),
+                 self.object_key(bucket, key), etag.strip('"'), size)
+            )
+
+    def release(self, bucket: str, key: str, etag: str, size: int) -> None:
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "DELETE FROM processed_objects WHERE object_key = ? AND etag = ? AND size = ? AND status = ?",
+                (self.object_key(bucket, key), etag.strip('"'), size, IN_PROGRESS)
+            )
+
+class DynamoDBLedger(ProcessedLedger):
+    """
+    Stores processed objects in a DynamoDB table whose partition key is the string attribute 'object_key'.
+
+    Args:
+        table_name (str): The name of the DynamoDB table.
+        claim_timeout_seconds (int, optional): Default lifetime of a claim when `claim` gets no timeout. Default is 900.
+    """
+
+    def __init__(self, table_name: str, claim_timeout_seconds: int = 900):
+        super().__init__(claim_timeout_seconds)
+        self.table = boto3.resource('dynamodb').Table(table_name)
+
+    def claim(self, bucket: str, key: str, etag: str, size: int, timeout_seconds: float = None) -> str:
+        object_key = self.object_key(bucket, key)
+        etag = etag.strip('"')
+
+        try:
+            self.table.put_item(
+                Item={
+                    'object_key': object_key,
+                    'bucket': bucket,
+                    'key': key,
+                    'etag': etag,
+                    'size': size,
+                    'status': IN_PROGRESS,
+                    'expires_at': self._expires_at(timeout_seconds)
+                },
+                ConditionExpression=(
+                    'attribute_not_exists(object_key) OR etag <> :etag OR #size <> :size '
+                    'OR (#status = :in_progress AND expires_at < :now)'
+                ),
+                ExpressionAttributeNames={'#status': 'status', '#size': 'size'},
+                ExpressionAttributeValues={
+                    ':etag': etag,
+                    ':size': size,
+                    ':in_progress': IN_PROGRESS,
+                    ':now': int(time.time())
+                }
+            )
+            return CLAIMED
+
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            item = self.table.get_item(Key={'object_key': object_key}, ConsistentRead=True).get('Item', {})
+            return PROCESSED if item.get('status') == PROCESSED else IN_PROGRESS
+
+    def mark_processed(self, bucket: str, key: str, etag: str, size: int, output_paths: List[str]) -> None:
+        try:
+            self.table.update_item(
+                Key={'object_key': self.object_key(bucket, key)},
+                UpdateExpression='SET #status = :processed, output_paths = :output_paths, processed_at = :processed_at',
+                ConditionExpression='etag = :etag AND #size = :size',
+                ExpressionAttributeNames={'#status': 'status', '#size': 'size'},
+                ExpressionAttributeValues={
+                    ':processed': PROCESSED,
+                    ':output_paths': output_paths,
+                    ':processed_at': datetime.utcnow().isoformat(),
+                    ':etag': etag.strip('"'),
+                    ':size': size
+                }
+            )
+
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            print(f"A newer version of {self.object_key(bucket, key)} was claimed. Ledger not updated.")
+
+    def release(self, bucket: str, key: str, etag: str, size: int) -> None:
+        try:
+            self.table.delete_item(
+                Key={'object_key': self.object_key(bucket, key)},
+                ConditionExpression='etag = :etag AND #size = :size AND #status = :in_progress',
+                ExpressionAttributeNames={'#status': 'status', '#size': 'size'},
+                ExpressionAttributeValues={':etag': etag.strip('"'), ':size': size, ':in_progress': IN_PROGRESS}
+            )
+
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            pass
+
+def get_ledger(backend: str, location: str) -> ProcessedLedger:
+    """
+    Creates the processed-object ledger for the given backend.
+
+    Args:
+        backend (str): The ledger backend. Options: 'dynamodb', 'sqlite'.
+        location (str): The DynamoDB table name or the SQLite file path.
+
+    Returns:
+        ProcessedLedger: The ledger instance.
+
+    Raises:
+        ValueError: If the backend is not supported.
+    """
+    if backend.lower() == 'dynamodb':
+        return DynamoDBLedger(location)
+
+    elif backend.lower() == 'sqlite':
+        return SQLiteLedger(location)
+
+    raise ValueError("Unsupported ledger backend. Use 'dynamodb' or 'sqlite'.")
@@ -2,7 +2,10 @@ from pathlib import Path
 import awswrangler as wr
 from pandas import DataFrame
 
-def extract_file(path: str = None, bucket: str = None, key: str = None, sheet_name: str = None) -> DataFrame:
+from utils import cache_utils as cu
+
+def extract_file(path: str = None, bucket: str = None, key: str = None, sheet_name: str = None,
+                 cache_dir: str = None, cache_max_size_mb: int = 1024, cache_zero_copy: bool = False) -> DataFrame:
     """
     General function to extract data from different file types (CSV, JSON, Parquet, Excel) stored in S3.
 
@@ -11,6 +14,11 @@ def extract_file(path: str = None, bucket: str = None, key: str = None, sheet_na
         bucket (str, optional): The name of the S3 bucket.
         key (str, optional): The file path within the S3 bucket.
         sheet_name (str, optional): The name of the sheet to extract in case of Excel. If not provided, the first sheet will be used.
+        cache_dir (str, optional): Local directory used to cache the parsed file, keyed by S3 path and ETag.
+            If provided, unchanged objects are loaded from the cache after a HEAD request instead of being downloaded and parsed again.
+        cache_max_size_mb (int, optional): Maximum size of the cache directory in MB. Least recently used files are evicted. Default is 1024.
+        cache_zero_copy (bool, optional): If True, numeric columns loaded from the cache are read-only views over the memory-mapped file,
+            so in-place assignments on them fail. Default is False (a writable copy, like a cache miss).
 
     Returns:
         pd.DataFrame: Data from the file as a pandas DataFrame.
@@ -19,29 +27,65 @@ def extract_file(path: str = None, bucket: str = None, key: str = None, sheet_na
         ValueError: If neither `path` nor both `bucket` and `key` are provided.
         RuntimeError: If the file extension is not supported or an error occurs during extraction.
     """
-    
+
     if not path:
         if not bucket or not key:
             raise ValueError("Either `path` or both `bucket` and `key` must be provided.")
         path = f's3://{bucket}/{key}'
-    
+
     file_extension = Path(path).suffix.lower()
 
+    if sheet_name is None and file_extension in ['.xlsx', '.xls']:
+        sheet_name = 0
+
+    if cache_dir:
+        cache_key = cu.build_cache_key(path, cu.get_s3_etag(path), sheet_name)
+        df = cu.read_cached_frame(cache_dir, cache_key, zero_copy=cache_zero_copy)
+
+        if df is not None:
+            print(f"Loaded {path} from cache.")
+            return df
+
+    df = _read_file(path, file_extension, sheet_name)
+
+    if cache_dir:
+        if isinstance(df, DataFrame):
+            cu.write_cached_frame(cache_dir, cache_key, df, max_size_mb=cache_max_size_mb)
+        else:
+            print(f"Result of {path} is a {type(df).__name__}, not a DataFrame. Skipping cache.")
+
+    return df
+
+def _read_file(path: str, file_extension: str, sheet_name: str = None) -> DataFrame:
+    """
+    Reads a file stored in S3 according to its extension.
+
+    Args:
+        path (str): Full S3 path.
+        file_extension (str): The lowercase file extension (e.g., ".csv").
+        sheet_name (str, optional): The name of the sheet to extract in case of Excel.
+
+    Returns:
+        pd.DataFrame: Data from the file as a pandas DataFrame.
+
+    Raises:
+        RuntimeError: If the file extension is not supported or an error occurs during extraction.
+    """
     try:
         if file_extension == '.parquet':
             return wr.s3.read_parquet(path)
-        
+
         elif file_extension == '.csv':
             return wr.s3.read_csv(path)
-        
+
         elif file_extension == '.json':
             return wr.s3.read_json(path)
-        
+
         elif file_extension in ['.xlsx', '.xls']:
             return wr.s3.read_excel(path, sheet_name=sheet_name)
-        
+
         else:
             raise RuntimeError(f"Unsupported file extension: {file_extension}")
-        
+
     except Exception as e:
         raise RuntimeError(f"Error extracting data from {path}: {e}")
@@ -0,0 +1,201 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Optional, Tuple
+from pandas import DataFrame
+
+from utils import database_utils as du
+from utils.watermark_utils import WatermarkStore, get_max_watermark
+from extract.extract_athena import extract_athena
+
+def _build_incremental_query(query: str, watermark_column: str, condition: str, inclusive: bool = False) -> str:
+    """
+    Wraps a query so that only rows past the watermark are returned.
+
+    Args:
+        query (str): The base SQL query.
+        watermark_column (str): The column used as watermark.
+        condition (str): The right side of the comparison (a placeholder or a SQL literal).
+        inclusive (bool, optional): If True, rows equal to the watermark are also returned. Default is False.
+
+    Returns:
+        str: The incremental SQL query.
+    """
+    query = query.strip().rstrip(';')
+    operator = '>=' if inclusive else '>'
+
+    return f"SELECT * FROM ({query}) src WHERE src.{watermark_column} {operator} {condition}"
+
+def _apply_lookback(value: Any, lookback: Any) -> Any:
+    """
+    Moves the watermark back by `lookback` so late-committed rows are extracted again.
+
+    Args:
+        value (Any): The last committed watermark.
+        lookback (Any): A timedelta for date/datetime watermarks, an int for int watermarks,
+            or a number for float and Decimal watermarks.
+
+    Returns:
+        Any: The watermark used in the query.
+
+    Raises:
+        ValueError: If the lookback cannot be represented exactly in the watermark type.
+    """
+    if lookback is None:
+        return value
+
+    if isinstance(value, (date, datetime)) and isinstance(lookback, timedelta):
+        return value - lookback
+
+    if isinstance(lookback, bool) or isinstance(value, bool):
+        raise ValueError(f"Invalid lookback {lookback!r} for a watermark of type {type(value).__name__}.")
+
+    # Integer watermarks only accept integer lookbacks, so the window is never truncated
+    if isinstance(value, int) and isinstance(lookback, int):
+        return value - lookback
+
+    if isinstance(value, float) and isinstance(lookback, (int, float)):
+        return value - lookback
+
+    # Decimal is built from the text of the lookback, avoiding binary float noise in the query
+    if isinstance(value, Decimal) and isinstance(lookback, (int, float, Decimal)):
+        return value - Decimal(str(lookback))
+
+    raise ValueError(f"Invalid lookback {lookback!r} for a watermark of type {type(value).__name__}.")
+
+def _next_watermark(df: DataFrame, watermark_column: str, last_watermark: Optional[Any]) -> Optional[Any]:
+    """
+    Returns the watermark to commit after the extraction. It never moves backwards, even when
+    the lookback window only returned rows at or below the last watermark.
+
+    Args:
+        df (pd.DataFrame): The extracted data.
+        watermark_column (str): The column used as watermark.
+        last_watermark (Any, optional): The last committed watermark.
+
+    Returns:
+        Optional[Any]: The new watermark, or None if there is nothing to commit.
+    """
+    new_watermark = get_max_watermark(df, watermark_column)
+
+    if new_watermark is None or last_watermark is None:
+        return new_watermark
+
+    return new_watermark if new_watermark > last_watermark else None
+
+def _to_athena_literal(value: Any) -> str:
+    """
+    Converts a watermark value into an Athena (Trino) SQL literal.
+
+    Args:
+        value (Any): The watermark value.
+
+    Returns:
+        str: The SQL literal.
+    """
+    if isinstance(value, datetime):
+        return f"TIMESTAMP '{value.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}'"
+
+    if isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return str(value)
+
+    return "'" + str(value).replace("'", "''") + "'"
+
+def extract_incremental_db(conn: Any, store: WatermarkStore, source: str, table: str, query: str,
+                           watermark_column: str, placeholder: str = '%s', lookback: Any = None,
+                           inclusive: bool = False) -> Tuple[DataFrame, Optional[Any]]:
+    """
+    Executes a query on a PostgreSQL or SQL Server database fetching only rows past the last watermark.
+
+    The watermark is NOT committed by this function. Commit the returned value with
+    `watermark_utils.pending_watermark` (or `store.set`) after the downstream load succeeds.
+
+    With `lookback` or `inclusive`, rows already extracted may be returned again, so the
+    downstream load must deduplicate or upsert them (e.g., `overwrite_partitions` or a delete_condition).
+
+    Args:
+        conn (Any): Database connection object (psycopg2 or pyodbc connection).
+        store (WatermarkStore): The state store holding the watermarks.
+        source (str): The source identifier (e.g., the secret name).
+        table (str): The table identifier used to track the watermark.
+        query (str): The base SQL query, written as plain SQL without parameters (literal '%' are escaped
+            automatically for psycopg2). It must return the watermark column.
+        watermark_column (str): Monotonically increasing column (e.g., 'updated_at' or 'id').
+        placeholder (str, optional): Parameter placeholder of the driver. Default is '%s' (psycopg2). Use '?' for pyodbc.
+        lookback (Any, optional): Overlap window subtracted from the last watermark (a timedelta for date/datetime
+            columns or a number for numeric ones). Use it with timestamp columns so rows committed late by long
+            transactions are not lost.
+        inclusive (bool, optional): If True, rows equal to the last watermark are also returned. Default is False.
+
+    Returns:
+        tuple: A tuple containing the extracted DataFrame and the new watermark (None if it did not advance).
+
+    Raises:
+        RuntimeError: If there is any error executing the query.
+    """
+    last_watermark = store.get(source, table)
+
+    if last_watermark is None:
+        print(f"No watermark found for {source}.{table}. Running full extraction.")
+        df = du.execute_query(conn, query)
+    else:
+        query_watermark = _apply_lookback(last_watermark, lookback)
+        print(f"Extracting {source}.{table} with {watermark_column} {'>=' if inclusive else '>'} {query_watermark}.")
+        # pyformat drivers (psycopg2) read '%' as a parameter marker once parameters are passed
+        base_query = query.replace('%', '%%') if placeholder.startswith('%') else query
+        incremental_query = _build_incremental_query(base_query, watermark_column, placeholder, inclusive)
+        df = du.execute_query(conn, incremental_query, parameters=(query_watermark,))
+
+    print(f"Extracted {len(df)} rows from {source}.{table}.")
+
+    return df, _next_watermark(df, watermark_column, last_watermark)
+
+def extract_incremental_athena(store: WatermarkStore, table: str, query: str, database: str, watermark_column: str,
+                               s3_output: str = None, ctas_approach: bool = False, lookback: Any = None,
+                               inclusive: bool = False) -> Tuple[DataFrame, Optional[Any]]:
+    """
+    Executes a SQL query on AWS Athena fetching only rows past the last watermark.
+
+    The watermark is tracked under the Athena database as source and is NOT committed by this
+    function. Commit the returned value with `watermark_utils.pending_watermark` (or `store.set`)
+    after the downstream load succeeds.
+
+    With `lookback` or `inclusive`, rows already extracted may be returned again, so the
+    downstream load must deduplicate or upsert them (e.g., `overwrite_partitions` or a delete_condition).
+
+    Args:
+        store (WatermarkStore): The state store holding the watermarks.
+        table (str): The table identifier used to track the watermark.
+        query (str): The base SQL query. It must return the watermark column.
+        database (str): The Athena database to use.
+        watermark_column (str): Monotonically increasing column (e.g., 'updated_at' or 'dt').
+        s3_output (str, optional): The S3 location where results will be stored (required if ctas_approach is True).
+        ctas_approach (bool, optional): If True, uses the Create Table As (CTAS) approach for executing the query.
+        lookback (Any, optional): Overlap window subtracted from the last watermark (a timedelta for date/datetime
+            columns or a number for numeric ones). Use it with timestamp columns so rows committed late by long
+            transactions are not lost.
+        inclusive (bool, optional): If True, rows equal to the last watermark are also returned. Default is False.
+
+    Returns:
+        tuple: A tuple containing the extracted DataFrame and the new watermark (None if it did not advance).
+
+    Raises:
+        ValueError: If `s3_output` is missing when `ctas_approach` is True.
+        RuntimeError: If an error occurs during extraction.
+    """
+    last_watermark = store.get(database, table)
+
+    if last_watermark is None:
+        print(f"No watermark found for {database}.{table}. Running full extraction.")
+    else:
+        query_watermark = _apply_lookback(last_watermark, lookback)
+        print(f"Extracting {database}.{table} with {watermark_column} {'>=' if inclusive else '>'} {query_watermark}.")
+        query = _build_incremental_query(query, watermark_column, _to_athena_literal(query_watermark), inclusive)
+
+    df = extract_athena(query, database, s3_output=s3_output, ctas_approach=ctas_approach)
+
+    print(f"Extracted {len(df)} rows from {database}.{table}.")
+
+    return df, _next_watermark(df, watermark_column, last_watermark)
@@ -2,8 +2,11 @@ import awswrangler as wr
 from pandas import DataFrame
 from typing import List
 
+from load.load_partitioned import load_partitioned
+
 def load_csv(df: DataFrame, path: str, sep: str = ';', index: bool = False, 
-             partition_cols: list = None, mode: str = 'append') -> List[str]:
+             partition_cols: list = None, mode: str = 'append', max_workers: int = None,
+             target_file_size_mb: int = 128) -> List[str]:
     """
     Saves a DataFrame as a CSV file to S3 using AWS Wrangler.
 
@@ -14,6 +17,9 @@ def load_csv(df: DataFrame, path: str, sep: str = ';', index: bool = False,
         index (bool, optional): Whether to write row names (index). Default is False.
         partition_cols (list, optional): Columns used to partition the dataset.
         mode (str, optional): Write mode for the CSV file. Can be 'append' (default), 'overwrite', or 'overwrite_partitions'.
+        max_workers (int, optional): If provided with `partition_cols`, partitions are written concurrently
+            by up to `max_workers` threads (see `load_partitioned`).
+        target_file_size_mb (int, optional): Target file size in MB when `max_workers` is provided. Default is 128.
 
     Returns:
         list: A list of the S3 paths where the CSV files were saved.
@@ -21,6 +27,12 @@ def load_csv(df: DataFrame, path: str, sep: str = ';', index: bool = False,
     Raises:
         RuntimeError: If there is an error saving the DataFrame to CSV.
     """
+    if partition_cols and max_workers:
+        stats = load_partitioned(df, path, partition_cols, file_format='csv', mode=mode, max_workers=max_workers,
+                                 target_file_size_mb=target_file_size_mb, sep=sep, index=index)
+
+        return [file_path for partition in stats for file_path in partition['paths']]
+
     try:
         response = wr.s3.to_csv(
             df, 
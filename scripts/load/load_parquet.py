@@ -2,8 +2,11 @@ import awswrangler as wr
 from pandas import DataFrame
 from typing import List
 
+from load.load_partitioned import load_partitioned
+
 def load_parquet(path: str, df: DataFrame, partition_cols: list = None, mode: str = 'append', 
-                 database: str = None, table: str = None) -> List[str]:
+                 database: str = None, table: str = None, max_workers: int = None,
+                 target_file_size_mb: int = 128, row_group_size: int = None) -> List[str]:
     """
     Saves a DataFrame as a Parquet file in an S3 bucket using AWS Wrangler.
 
@@ -17,6 +20,10 @@ def load_parquet(path: str, df: DataFrame, partition_cols: list = None, mode: st
             - 'overwrite_partitions': Replaces existing partitions but keeps the rest of the file.
         database (str, optional): The name of the AWS Glue Data Catalog database.
         table (str, optional): The name of the table in the AWS Glue Data Catalog.
+        max_workers (int, optional): If provided with `partition_cols`, partitions are written concurrently
+            by up to `max_workers` threads (see `load_partitioned`).
+        target_file_size_mb (int, optional): Target file size in MB when `max_workers` is provided. Default is 128.
+        row_group_size (int, optional): Maximum number of rows in each row group when `max_workers` is provided.
 
     Returns:
         list: A list of the S3 paths where the Parquet files were saved.
@@ -24,6 +31,13 @@ def load_parquet(path: str, df: DataFrame, partition_cols: list = None, mode: st
     Raises:
         RuntimeError: If there is an error saving the DataFrame to Parquet.
     """
+    if partition_cols and max_workers:
+        stats = load_partitioned(df, path, partition_cols, file_format='parquet', mode=mode,
+                                 max_workers=max_workers, target_file_size_mb=target_file_size_mb,
+                                 row_group_size=row_group_size, database=database, table=table)
+
+        return [file_path for partition in stats for file_path in partition['paths']]
+
     try:
         response = wr.s3.to_parquet(
             df, 
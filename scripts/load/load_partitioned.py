@@ -0,0 +1,220 @@
+import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
+import awswrangler as wr
+from io import BytesIO
+from uuid import uuid4
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pandas import DataFrame, isna
+from typing import Any, Dict, List, Tuple
+
+HIVE_DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+SAMPLE_ROWS = 10000
+
+def _split_s3_path(path: str) -> Tuple[str, str]:
+    """
+    Splits an S3 path (e.g., "s3://my-bucket/my/prefix") into bucket and key.
+    """
+    bucket, _, key = path.replace('s3://', '', 1).partition('/')
+    return bucket, key
+
+def _partition_value(value: Any) -> str:
+    """
+    Converts a partition value into its Hive path representation.
+    """
+    if value is None or (not isinstance(value, (list, tuple)) and isna(value)):
+        return HIVE_DEFAULT_PARTITION
+
+    return str(value)
+
+def _delete_prefix(client: Any, bucket: str, prefix: str) -> None:
+    """
+    Deletes every object under a prefix of an S3 bucket.
+    """
+    paginator = client.get_paginator('list_objects_v2')
+
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        objects = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+
+        if objects:
+            client.delete_objects(Bucket=bucket, Delete={'Objects': objects, 'Quiet': True})
+
+def _serialize(df: DataFrame, file_format: str, schema: pa.Schema, row_group_size: int,
+               sep: str, index: bool) -> BytesIO:
+    """
+    Serializes a DataFrame into an in-memory Parquet or CSV file. Parquet files are written
+    with the dataset schema, so every file has the same column types.
+    """
+    buffer = BytesIO()
+
+    if file_format == 'parquet':
+        table = pa.Table.from_pandas(df, schema=schema, preserve_index=index)
+        pq.write_table(table, buffer, row_group_size=row_group_size, compression='snappy')
+    else:
+        buffer.write(df.to_csv(sep=sep, index=index).encode('utf-8'))
+
+    buffer.seek(0)
+    return buffer
+
+def _estimate_rows_per_file(df: DataFrame, file_format: str, schema: pa.Schema, target_bytes: int,
+                            sep: str, index: bool) -> int:
+    """
+    Estimates how many rows fit in a file of `target_bytes` by serializing a sample of the DataFrame.
+    """
+    sample = df.iloc[:SAMPLE_ROWS]
+    sample_bytes = _serialize(sample, file_format, schema, None, sep, index).getbuffer().nbytes
+
+    return max(1, int(target_bytes * len(sample) // max(sample_bytes, 1)))
+
+def _write_partition(client: Any, df: DataFrame, bucket: str, prefix: str, partition: Dict[str, str],
+                     file_format: str, mode: str, schema: pa.Schema, target_bytes: int, rows_per_file: int,
+                     row_group_size: int, sep: str, index: bool) -> Dict:
+    """
+    Writes one partition, split into files of about `target_bytes`, and returns its stats.
+
+    The first file uses the estimated `rows_per_file`. The following ones are resized from the
+    bytes per row actually written, since the data of each partition compresses differently.
+    """
+    if mode == 'overwrite_partitions':
+        _delete_prefix(client, bucket, f'{prefix}/')
+
+    extension = 'snappy.parquet' if file_format == 'parquet' else 'csv'
+    file_id = uuid4().hex
+    paths = []
+    total_bytes = 0
+
+    start = 0
+
+    while start < len(df):
+        chunk = df.iloc[start:start + rows_per_file]
+        buffer = _serialize(chunk, file_format, schema, row_group_size, sep, index)
+        file_bytes = buffer.getbuffer().nbytes
+        key = f'{prefix}/{len(paths):05d}_{file_id}.{extension}'
+
+        client.upload_fileobj(buffer, bucket, key)
+        paths.append(f's3://{bucket}/{key}')
+
+        total_bytes += file_bytes
+        start += len(chunk)
+        rows_per_file = max(1, int(target_bytes * len(chunk) // max(file_bytes, 1)))
+
+    return {
+        'partition': partition,
+        'path': f's3://{bucket}/{prefix}/',
+        'rows': len(df),
+        'files': len(paths),
+        'bytes': total_bytes,
+        'paths': paths
+    }
+
+def load_partitioned(df: DataFrame, path: str, partition_cols: list, file_format: str = 'parquet',
+                     mode: str = 'append', max_workers: int = 8, target_file_size_mb: int = 128,
+                     row_group_size: int = None, sep: str = ';', index: bool = False,
+                     database: str = None, table: str = None) -> List[Dict]:
+    """
+    Saves a DataFrame as a Hive-partitioned dataset in S3, writing the partitions concurrently.
+
+    Rows are grouped by partition with a single groupby and each partition is written by a bounded
+    thread pool, with at most `2 * max_workers` partitions in memory at the same time. Oversized
+    partitions are split into several files of roughly `target_file_size_mb`, sized from the bytes per
+    row of the serialized output, so skewed partitions do not produce one huge file. All Parquet files
+    share the schema of the whole DataFrame.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to be saved.
+        path (str): The S3 path of the dataset (e.g., "s3://my-bucket/my-table").
+        partition_cols (list): Columns used to partition the dataset.
+        file_format (str, optional): 'parquet' (default) or 'csv'.
+        mode (str, optional): Write mode. Can be 'append' (default), 'overwrite', or 'overwrite_partitions'.
+        max_workers (int, optional): Maximum number of partitions written at the same time. Default is 8.
+        target_file_size_mb (int, optional): Target size of each file in MB. Default is 128.
+        row_group_size (int, optional): Maximum number of rows in each Parquet row group. Default is the pyarrow default.
+        sep (str, optional): Separator to use for CSV files. Default is ';'.
+        index (bool, optional): Whether to write the DataFrame index. Default is False.
+        database (str, optional): The name of the AWS Glue Data Catalog database (Parquet only).
+        table (str, optional): The name of the table in the AWS Glue Data Catalog (Parquet only).
+
+    Returns:
+        list: A list of dicts with the stats of each partition ('partition', 'path', 'rows', 'files', 'bytes', 'paths').
+
+    Raises:
+        ValueError: If the arguments are invalid.
+        RuntimeError: If there is an error saving the partitions.
+    """
+    if not partition_cols:
+        raise ValueError("The parameter 'partition_cols' must be provided.")
+
+    if file_format not in ('parquet', 'csv'):
+        raise ValueError("Unsupported file format. Use 'parquet' or 'csv'.")
+
+    if mode not in ('append', 'overwrite', 'overwrite_partitions'):
+        raise ValueError("Unsupported mode. Use 'append', 'overwrite' or 'overwrite_partitions'.")
+
+    if bool(database) != bool(table):
+        raise ValueError("Both 'database' and 'table' must be provided to register the dataset in the Glue Data Catalog.")
+
+    if (database or table) and file_format != 'parquet':
+        raise ValueError("The Glue Data Catalog is only supported for Parquet files.")
+
+    try:
+        client = boto3.client('s3')
+        bucket, base_prefix = _split_s3_path(path.rstrip('/'))
+
+        if mode == 'overwrite':
+            _delete_prefix(client, bucket, f'{base_prefix}/')
+
+        data_cols = [col for col in df.columns if col not in partition_cols]
+        schema = pa.Schema.from_pandas(df[data_cols], preserve_index=index) if file_format == 'parquet' else None
+        target_bytes = target_file_size_mb * 1024 ** 2
+        rows_per_file = _estimate_rows_per_file(df.iloc[:SAMPLE_ROWS][data_cols], file_format, schema, target_bytes, sep, index)
+
+        stats = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+
+            for values, group in df.groupby(partition_cols, sort=False, dropna=False, observed=True):
+                if not isinstance(values, tuple):
+                    values = (values,)
+
+                partition = {col: _partition_value(value) for col, value in zip(partition_cols, values)}
+                prefix = '/'.join([base_prefix] + [f'{col}={value}' for col, value in partition.items()])
+
+                # Bound the partition copies waiting in the queue, not only the running threads
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    stats.extend(future.result() for future in done)
+
+                pending.add(executor.submit(
+                    _write_partition, client, group[data_cols], bucket, prefix, partition, file_format,
+                    mode, schema, target_bytes, rows_per_file, row_group_size, sep, index
+                ))
+
+            stats.extend(future.result() for future in wait(pending).done)
+
+        if database and table:
+            columns_types, partitions_types = wr.catalog.extract_athena_types(
+                df=df, index=index, partition_cols=partition_cols, file_format='parquet'
+            )
+            wr.catalog.create_parquet_table(
+                database=database,
+                table=table,
+                path=path,
+                columns_types=columns_types,
+                partitions_types=partitions_types,
+                compression='snappy',
+                mode='overwrite' if mode == 'overwrite' else 'append'
+            )
+            wr.catalog.add_parquet_partitions(
+                database=database,
+                table=table,
+                partitions_values={s['path']: list(s['partition'].values()) for s in stats},
+                compression='snappy'
+            )
+
+        print(f"Successfully saved {len(df)} rows to {len(stats)} partitions at {path}.")
+
+        return stats
+
+    except Exception as e:
+        raise RuntimeError(f"Error saving the partitioned DataFrame to {file_format}: {e}")
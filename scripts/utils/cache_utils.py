@@ -0,0 +1,202 @@
+import os
+import json
+import boto3
+import pickle
+import hashlib
+from uuid import uuid4
+import pyarrow as pa
+from pathlib import Path
+from pandas import DataFrame
+from typing import Optional
+
+CACHE_EXTENSION = '.arrow'
+PICKLED_COLUMNS_KEY = b'etl_cache_pickled_columns'
+
+def _to_arrow_table(df: DataFrame) -> pa.Table:
+    """
+    Converts a DataFrame into an Arrow table for the cache.
+
+    Object columns that Arrow cannot convert (e.g., mixed ints and strings, common in `read_excel`
+    output) are stored as pickled values, and their positions are recorded in the schema metadata
+    so `_to_pandas` restores the original Python objects.
+    """
+    try:
+        return pa.Table.from_pandas(df)
+
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df = df.copy(deep=False)
+        pickled = []
+
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+
+            if column.dtype != object:
+                continue
+
+            try:
+                pa.array(column, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df.isetitem(position, [pickle.dumps(value) for value in column])
+                pickled.append(position)
+
+        table = _to_arrow_table(df)
+        metadata = {**(table.schema.metadata or {}), PICKLED_COLUMNS_KEY: json.dumps(pickled).encode('utf-8')}
+
+        return table.replace_schema_metadata(metadata)
+
+def _to_pandas(table: pa.Table, zero_copy: bool) -> DataFrame:
+    """
+    Converts a cached Arrow table back into a DataFrame, unpickling the columns stored by `_to_arrow_table`.
+    """
+    pickled = json.loads((table.schema.metadata or {}).get(PICKLED_COLUMNS_KEY, b'[]'))
+
+    if zero_copy:
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+    else:
+        df = table.to_pandas()
+
+    for position in pickled:
+        df.isetitem(position, [pickle.loads(value) for value in df.iloc[:, position]])
+
+    return df
+
+def get_s3_etag(path: str) -> str:
+    """
+    Retrieves the ETag of an S3 object with a HEAD request, without downloading it.
+
+    Args:
+        path (str): Full S3 path (e.g., "s3://my-bucket/my-file.xlsx").
+
+    Returns:
+        str: The ETag of the object.
+
+    Raises:
+        RuntimeError: If there is an error retrieving the object metadata.
+    """
+    bucket, _, key = path.replace('s3://', '', 1).partition('/')
+
+    try:
+        response = boto3.client('s3').head_object(Bucket=bucket, Key=key)
+        return response['ETag'].strip('"')
+
+    except Exception as e:
+        raise RuntimeError(f"Error retrieving the ETag of {path}: {e}")
+
+def build_cache_key(path: str, etag: str, *args) -> str:
+    """
+    Builds the cache key of a parsed S3 object. Any change of the ETag produces a new key.
+
+    Args:
+        path (str): Full S3 path of the object.
+        etag (str): The ETag of the object.
+        *args: Any read option that changes the parsed result (e.g., the Excel sheet name).
+
+    Returns:
+        str: A hexadecimal cache key.
+    """
+    raw = '|'.join([path, etag] + [str(arg) for arg in args])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def read_cached_frame(cache_dir: str, cache_key: str, zero_copy: bool = False) -> Optional[DataFrame]:
+    """
+    Reads a DataFrame from the local cache, memory-mapping the Arrow IPC file.
+
+    With `zero_copy`, the map is kept open and numeric columns without nulls are returned as
+    read-only views over it, so they are not copied into memory (strings are still converted).
+    In-place assignments on those columns fail; call `df.copy()` before modifying them.
+
+    Args:
+        cache_dir (str): The local cache directory.
+        cache_key (str): The cache key built with `build_cache_key`.
+        zero_copy (bool, optional): If True, keeps the columns backed by the memory map. Default is False.
+
+    Returns:
+        Optional[pd.DataFrame]: The cached DataFrame, or None if it is not cached.
+    """
+    file_path = Path(cache_dir) / f'{cache_key}{CACHE_EXTENSION}'
+
+    if not file_path.exists():
+        return None
+
+    try:
+        source = pa.memory_map(str(file_path), 'r')
+        table = pa.ipc.open_file(source).read_all()
+
+        df = _to_pandas(table, zero_copy)
+        del table
+
+        # With zero_copy the arrays keep the map alive, so the source is only closed otherwise
+        if not zero_copy:
+            source.close()
+
+        # Refresh the modification time so eviction follows the least recently used order
+        os.utime(file_path)
+
+        return df
+
+    except Exception as e:
+        print(f"Error reading cache file {file_path}. Ignoring cache: {e}")
+        file_path.unlink(missing_ok=True)
+        return None
+
+def write_cached_frame(cache_dir: str, cache_key: str, df: DataFrame, max_size_mb: int = 1024) -> None:
+    """
+    Writes a DataFrame to the local cache as an uncompressed Arrow IPC file and evicts
+    the least recently used files while the cache is larger than `max_size_mb`.
+
+    Errors are logged and ignored, since the cache is only an optimization.
+
+    Args:
+        cache_dir (str): The local cache directory.
+        cache_key (str): The cache key built with `build_cache_key`.
+        df (pd.DataFrame): The DataFrame to cache.
+        max_size_mb (int, optional): Maximum size of the cache directory in MB. Default is 1024.
+
+    Returns:
+        None
+    """
+    cache_path = Path(cache_dir)
+    file_path = cache_path / f'{cache_key}{CACHE_EXTENSION}'
+    tmp_path = cache_path / f'{cache_key}{CACHE_EXTENSION}.{uuid4().hex}.tmp'
+
+    try:
+        cache_path.mkdir(parents=True, exist_ok=True)
+        table = _to_arrow_table(df)
+
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        os.replace(tmp_path, file_path)
+        evict_cache(cache_dir, max_size_mb, keep=file_path.name)
+
+    except Exception as e:
+        print(f"Error writing cache file {file_path}. Skipping cache: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+def evict_cache(cache_dir: str, max_size_mb: int, keep: str = None) -> None:
+    """
+    Removes the least recently used files until the cache directory fits in `max_size_mb`.
+
+    Args:
+        cache_dir (str): The local cache directory.
+        max_size_mb (int): Maximum size of the cache directory in MB.
+        keep (str, optional): Name of a file that must not be evicted (e.g., the one just written).
+
+    Returns:
+        None
+    """
+    files = sorted(Path(cache_dir).glob(f'*{CACHE_EXTENSION}'), key=lambda f: f.stat().st_mtime)
+    total_size = sum(f.stat().st_size for f in files)
+    max_size = max_size_mb * 1024 ** 2
+
+    for file_path in files:
+        if total_size <= max_size:
+            break
+
+        if file_path.name == keep:
+            continue
+
+        total_size -= file_path.stat().st_size
+        file_path.unlink(missing_ok=True)
+        print(f"Evicted cache file {file_path.name}.")
@@ -0,0 +1,202 @@
+import json
+import sqlite3
+from pathlib import Path
+from decimal import Decimal
+from datetime import date, datetime
+from typing import Any, Optional
+from contextlib import contextmanager
+from pandas import DataFrame, Timestamp
+
+#------------------SERIALIZATION------------------#
+def _encode_watermark(value: Any) -> str:
+    """
+    Serializes a watermark value into a JSON string that keeps its original type.
+
+    Args:
+        value (Any): The watermark value (int, float, Decimal, str, date or datetime).
+
+    Returns:
+        str: A JSON string with the value and its type.
+
+    Raises:
+        ValueError: If the value type is not supported.
+    """
+    if isinstance(value, Timestamp):
+        value = value.to_pydatetime()
+
+    if isinstance(value, datetime):
+        return json.dumps({'type': 'datetime', 'value': value.isoformat()})
+
+    if isinstance(value, date):
+        return json.dumps({'type': 'date', 'value': value.isoformat()})
+
+    if isinstance(value, Decimal):
+        return json.dumps({'type': 'Decimal', 'value': str(value)})
+
+    if isinstance(value, (bool, int, float, str)):
+        return json.dumps({'type': type(value).__name__, 'value': value})
+
+    raise ValueError(f"Unsupported watermark type: {type(value).__name__}")
+
+def _decode_watermark(raw: str) -> Any:
+    """
+    Deserializes a watermark value created by `_encode_watermark`.
+
+    Args:
+        raw (str): The JSON string stored in the state store.
+
+    Returns:
+        Any: The watermark value with its original type.
+    """
+    payload = json.loads(raw)
+
+    if payload['type'] == 'datetime':
+        return datetime.fromisoformat(payload['value'])
+
+    if payload['type'] == 'date':
+        return date.fromisoformat(payload['value'])
+
+    if payload['type'] == 'Decimal':
+        return Decimal(payload['value'])
+
+    return payload['value']
+
+def get_max_watermark(df: DataFrame, column: str) -> Optional[Any]:
+    """
+    Returns the highest value of the watermark column as a native Python object.
+
+    Args:
+        df (pd.DataFrame): The extracted data.
+        column (str): The watermark column.
+
+    Returns:
+        Optional[Any]: The maximum value, or None if the DataFrame is empty.
+
+    Raises:
+        ValueError: If the watermark column is not present in the DataFrame or its type cannot be stored.
+    """
+    if column not in df.columns:
+        raise ValueError(f"The watermark column '{column}' is not present in the extracted data.")
+
+    if df.empty:
+        return None
+
+    value = df[column].max()
+
+    if value is None or value != value:
+        return None
+
+    if isinstance(value, Timestamp):
+        value = value.to_pydatetime()
+    elif hasattr(value, 'item'):
+        value = value.item()
+
+    # Fail before the load instead of when the watermark is committed
+    _encode_watermark(value)
+
+    return value
+
+#------------------STATE STORES------------------#
+class WatermarkStore:
+    """
+    Base class for watermark state stores. A watermark is tracked per source and table.
+
+    Subclasses must implement `get` and `set`.
+    """
+
+    def get(self, source: str, table: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, source: str, table: str, value: Any) -> None:
+        raise NotImplementedError
+
+class SQLiteWatermarkStore(WatermarkStore):
+    """
+    Stores watermarks in a local SQLite database.
+
+    Args:
+        path (str, optional): Path to the SQLite file. Default is 'watermarks.db'.
+    """
+
+    def __init__(self, path: str = 'watermarks.db'):
+        self.path = path
+
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                "source TEXT NOT NULL, "
+                "table_name TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "updated_at TEXT NOT NULL, "
+                "PRIMARY KEY (source, table_name))"
+            )
+
+    def get(self, source: str, table: str) -> Optional[Any]:
+        with sqlite3.connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT value FROM watermarks WHERE source = ? AND table_name = ?",
+                (source, table)
+            ).fetchone()
+
+        return _decode_watermark(row[0]) if row else None
+
+    def set(self, source: str, table: str, value: Any) -> None:
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO watermarks (source, table_name, value, updated_at) VALUES (?, ?, ?, ?)",
+                (source, table, _encode_watermark(value), datetime.utcnow().isoformat())
+            )
+
+class JSONWatermarkStore(WatermarkStore):
+    """
+    Stores watermarks in a local JSON file.
+
+    Args:
+        path (str, optional): Path to the JSON file. Default is 'watermarks.json'.
+    """
+
+    def __init__(self, path: str = 'watermarks.json'):
+        self.path = Path(path)
+
+    def _read(self) -> dict:
+        if not self.path.exists():
+            return {}
+
+        return json.loads(self.path.read_text())
+
+    def get(self, source: str, table: str) -> Optional[Any]:
+        raw = self._read().get(source, {}).get(table)
+
+        return _decode_watermark(raw) if raw else None
+
+    def set(self, source: str, table: str, value: Any) -> None:
+        state = self._read()
+        state.setdefault(source, {})[table] = _encode_watermark(value)
+
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        tmp_path.write_text(json.dumps(state, indent=2))
+        tmp_path.replace(self.path)
+
+#------------------COMMIT------------------#
+@contextmanager
+def pending_watermark(store: WatermarkStore, source: str, table: str, value: Optional[Any]):
+    """
+    A context manager that commits a watermark only if the enclosed block succeeds.
+
+    Wrap the downstream load with it so a failed load does not advance the watermark
+    and the same rows are extracted again on the next run.
+
+    Args:
+        store (WatermarkStore): The state store.
+        source (str): The source identifier (e.g., secret name or Athena database).
+        table (str): The table identifier.
+        value (Any, optional): The new watermark. If None, nothing is committed.
+
+    Yields:
+        Any: The pending watermark value.
+    """
+    yield value
+
+    if value is not None:
+        store.set(source, table, value)
+        print(f"Watermark for {source}.{table} committed: {value}.")